@@ -10,15 +10,48 @@ Usage:
     python photo_date_updater.py <directory_path>
 """
 
+import io
+import itertools
+import mmap
 import os
 import sys
 import argparse
+import sqlite3
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 import exifread
 import logging
 
+# Setting a creation date is a single syscall-equivalent operation, so when
+# pyobjc is available we call the Foundation framework in-process instead of
+# paying a fork/exec per SetFile invocation
+try:
+    from Foundation import NSURL, NSDate, NSURLCreationDateKey
+except ImportError:
+    NSURL = None
+
+# Optional C-backed EXIF parser: libexiv2 walks the TIFF tree in native
+# code, typically an order of magnitude faster than exifread's pure-Python
+# parse. pyexiv2 documents itself as not thread-safe, so every call into
+# it is serialized behind _pyexiv2_lock; even single-threaded it beats
+# exifread by enough to be worth it
+try:
+    import pyexiv2
+except ImportError:
+    pyexiv2 = None
+
+_pyexiv2_lock = threading.Lock()
+
+# Optional, only needed for --parse-png: PNGs don't carry EXIF, but Pillow
+# can read the tEXt chunks where some tools record dates
+try:
+    from PIL import Image as PILImage
+except ImportError:
+    PILImage = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -27,77 +60,326 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # Supported image and video formats
-SUPPORTED_FORMATS = {'.jpg', '.jpeg', '.tiff', '.tif', '.png', '.heic', '.heif', '.cr2', '.nef', '.arw', '.mp4', '.mov', '.avi', '.mkv'}
+SUPPORTED_FORMATS = frozenset({'.jpg', '.jpeg', '.tiff', '.tif', '.png', '.heic', '.heif', '.cr2', '.nef', '.arw', '.mp4', '.mov', '.avi', '.mkv'})
+
+# Video container extensions, which carry QuickTime tags instead of EXIF
+VIDEO_EXTS = frozenset({'.mp4', '.mov', '.avi', '.mkv'})
 
 # EXIF date tags to check in order of preference
-EXIF_DATE_TAGS = [
+EXIF_DATE_TAGS = (
     'EXIF DateTimeOriginal',
     'EXIF DateTime',
     'Image DateTime',
     'EXIF SubSecTimeOriginal',
     'EXIF SubSecTime'
-]
+)
+
+# Minimum number of files before parallelizing metadata extraction;
+# below this the pool startup cost outweighs the parallel parse win
+MIN_PARALLEL_FILES = 8
+
+# How much of a file to read when looking for metadata. EXIF blocks live
+# near the start of the file, so a small window is usually enough; video
+# containers can place their metadata atoms much later, so they get a
+# larger one. Files whose metadata falls outside the window are re-read
+# in full as a fallback.
+HEADER_READ_BYTES = 128 * 1024
+VIDEO_READ_BYTES = 1024 * 1024
+
+# Maximum number of files passed to a single SetFile invocation
+SETFILE_BATCH_SIZE = 200
+
+# On-disk cache of parsed EXIF dates, keyed by path + mtime + size so any
+# edit to a file invalidates its entry automatically. Warm re-runs (e.g.
+# iterating with --dry-run) skip the parse entirely.
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'photo_date_updater')
+CACHE_DB = os.path.join(CACHE_DIR, 'exif.db')
+
+# sqlite3 connections reject cross-thread use, so each extraction worker
+# thread keeps its own connection here
+_cache_local = threading.local()
+
+# libexiv2 key names matching EXIF_DATE_TAGS, in the same preference order
+EXIV2_DATE_KEYS = (
+    'Exif.Photo.DateTimeOriginal',
+    'Exif.Photo.DateTimeDigitized',
+    'Exif.Image.DateTime',
+    'Exif.Photo.SubSecTimeOriginal',
+    'Exif.Photo.SubSecTime'
+)
 
 # Video metadata tags to check
-VIDEO_DATE_TAGS = [
+VIDEO_DATE_TAGS = (
     'QuickTime CreateDate',
     'QuickTime DateTimeOriginal',
     'QuickTime DateTime',
     'QuickTime CreationDate'
-]
+)
+
+# Set views of the tag tuples, for cheap "any date tag at all?" probes
+# before walking the priority order
+_EXIF_TAG_SET = frozenset(EXIF_DATE_TAGS)
+_VIDEO_TAG_SET = frozenset(VIDEO_DATE_TAGS)
 
 def is_supported_format(file_path):
     """Check if the file is a supported image format."""
-    suffix = Path(file_path).suffix.lower()
+    # os.path.splitext avoids constructing a Path just to read the suffix
+    suffix = os.path.splitext(str(file_path))[1].lower()
     is_supported = suffix in SUPPORTED_FORMATS
     if not is_supported:
         logger.debug(f"File format not recognized: {file_path} (suffix: '{suffix}')")
     return is_supported
 
-def get_exif_date(file_path):
+def iter_supported_files(root, with_stats=False):
+    """
+    Yield paths of supported files under root, recursively.
+
+    Walks with os.scandir so file/directory checks come from the readdir
+    data instead of an extra stat per entry, filters by suffix before
+    yielding, and never materializes the whole tree in memory. With
+    with_stats=True, yields (path, stat_result) pairs instead, reusing
+    the stat data the walk already fetched so downstream consumers (the
+    EXIF cache key needs mtime and size) don't pay another dentry lookup
+    per file.
+    """
+    stack = [str(root)]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError as e:
+            logger.warning(f"Could not read directory: {e}")
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    if os.path.splitext(entry.name)[1].lower() in SUPPORTED_FORMATS:
+                        if with_stats:
+                            try:
+                                yield entry.path, entry.stat(follow_symlinks=False)
+                            except OSError:
+                                yield entry.path, None
+                        else:
+                            yield entry.path
+
+def _exif_cache():
+    """
+    Open the on-disk EXIF date cache, once per thread.
+
+    get_exif_date runs on many extraction pool threads at once and sqlite3
+    connections can't be shared across threads, so each thread opens its
+    own; sqlite's own file locking coordinates the concurrent writers.
+    """
+    connection = getattr(_cache_local, 'connection', None)
+    if connection is None:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        connection = sqlite3.connect(CACHE_DB, timeout=5)
+        connection.execute(
+            'CREATE TABLE IF NOT EXISTS exif_dates (key TEXT PRIMARY KEY, date TEXT)'
+        )
+        connection.commit()
+        _cache_local.connection = connection
+    return connection
+
+def _cache_get(key):
+    """Look up a cache key. Returns (hit, date); a hit may carry None."""
+    try:
+        row = _exif_cache().execute('SELECT date FROM exif_dates WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            return False, None
+        # A malformed stored date counts as a miss, not a crash
+        return True, (datetime.fromisoformat(row[0]) if row[0] else None)
+    except Exception as e:
+        logger.debug(f"EXIF cache read failed: {e}")
+        return False, None
+
+def _cache_put(key, date):
+    """Store a parse result (including 'no date found') under a cache key."""
+    try:
+        conn = _exif_cache()
+        conn.execute(
+            'INSERT OR REPLACE INTO exif_dates (key, date) VALUES (?, ?)',
+            (key, date.isoformat() if date else None)
+        )
+        conn.commit()
+    except Exception as e:
+        logger.debug(f"EXIF cache write failed: {e}")
+
+def _parse_exif_datetime(date_str):
+    """
+    Parse a fixed-layout 'YYYY?MM?DD HH:MM:SS' date string.
+
+    EXIF and QuickTime dates keep every field at the same offset and only
+    vary the separator (':', '-' or '/'), so slicing and int() replaces
+    strptime's format machinery and the exception-driven fallback chain.
+    Returns None if the string doesn't hold a date.
+    """
+    if len(date_str) < 19:
+        return None
+    try:
+        return datetime(int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]),
+                        int(date_str[11:13]), int(date_str[14:16]), int(date_str[17:19]))
+    except ValueError:
+        return None
+
+def _read_exif_tags(file_path):
+    """
+    Read metadata tags from a file through a bounded, memory-mapped window.
+
+    Mapping the header instead of read()ing it into a heap buffer lets
+    exifread seek and slice directly against kernel page-cache pages, with
+    no userspace copy, and repeated scans of the same files are served
+    straight from the page cache. The stop_tag makes exifread bail out as
+    soon as the preferred date tag has been parsed. If the window turns up
+    nothing and the file extends beyond it, retry with the full file.
+    """
+    file_ext = Path(file_path).suffix.lower()
+    window = VIDEO_READ_BYTES if file_ext in VIDEO_EXTS else HEADER_READ_BYTES
+
+    with open(file_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            # mmap can't map empty files
+            return exifread.process_file(io.BytesIO(b''), details=False, stop_tag='DateTimeOriginal')
+        try:
+            with mmap.mmap(f.fileno(), min(window, size), access=mmap.ACCESS_READ) as mm:
+                tags = exifread.process_file(mm, details=False, stop_tag='DateTimeOriginal')
+        except Exception as e:
+            if size <= window:
+                # The whole file was mapped, so there is nothing more to read
+                raise
+            logger.debug(f"Header-window parse failed for {file_path}, retrying with full file: {e}")
+            tags = {}
+
+    if not tags and size > window:
+        # Metadata may sit beyond the window; fall back to a full read
+        with open(file_path, 'rb') as f:
+            tags = exifread.process_file(f, details=False, stop_tag='DateTimeOriginal')
+
+    return tags
+
+def get_exif_date(file_path, parse_png=False, stat_result=None):
     """
     Extract the date from EXIF metadata of an image or video file.
     Returns a datetime object or None if no date found.
+
+    PNG files are skipped without being read, since PNGs don't carry EXIF
+    metadata; pass parse_png=True to look for dates in their text chunks
+    instead (requires Pillow). Results (including negatives) are cached on
+    disk keyed by path, mtime and size, so repeated runs over the same
+    directory skip the parse. Callers that already hold a stat result for
+    the file (e.g. from the directory walk) can pass it as stat_result to
+    avoid a second stat.
     """
+    if not parse_png and os.path.splitext(str(file_path))[1].lower() == '.png':
+        logger.debug(f"Skipping {file_path} - PNG files don't contain EXIF metadata (use --parse-png for text chunks)")
+        return None
+
     try:
-        with open(file_path, 'rb') as f:
-            tags = exifread.process_file(f, details=False)
-        
-        file_ext = Path(file_path).suffix.lower()
-        
-        # For video files, check video metadata tags first
-        if file_ext in {'.mp4', '.mov', '.avi', '.mkv'}:
-            for tag in VIDEO_DATE_TAGS:
-                if tag in tags:
+        st = stat_result if stat_result is not None else os.stat(file_path)
+        cache_key = f"{os.path.abspath(file_path)}:{st.st_mtime_ns}:{st.st_size}"
+    except OSError:
+        cache_key = None
+
+    if cache_key:
+        hit, date = _cache_get(cache_key)
+        if hit:
+            logger.debug(f"EXIF cache hit for {file_path}")
+            return date
+
+    date = _parse_exif_date(file_path, parse_png=parse_png)
+
+    if cache_key:
+        _cache_put(cache_key, date)
+
+    return date
+
+def _parse_exif_date_native(file_path):
+    """
+    Parse the date via libexiv2. Returns None if no date is found.
+
+    pyexiv2 is not thread-safe, so the native call is serialized across
+    the extraction pool; only the (fast) parse itself is under the lock,
+    key matching below happens concurrently.
+    """
+    with _pyexiv2_lock:
+        img = pyexiv2.Image(str(file_path))
+        try:
+            exif = img.read_exif()
+        finally:
+            img.close()
+
+    for key in EXIV2_DATE_KEYS:
+        value = exif.get(key)
+        if value:
+            date = _parse_exif_datetime(value)
+            if date is not None:
+                return date
+    return None
+
+def _parse_png_date(file_path):
+    """Read a date from PNG text chunks. Returns None if none is found."""
+    if PILImage is None:
+        logger.warning(f"--parse-png requires Pillow; skipping {file_path}")
+        return None
+
+    with PILImage.open(file_path) as img:
+        text_chunks = getattr(img, 'text', {})
+
+    for key in ('Creation Time', 'date:create', 'date:modify'):
+        value = text_chunks.get(key)
+        if value:
+            date = _parse_exif_datetime(value)
+            if date is not None:
+                return date
+            logger.warning(f"Could not parse PNG date '{value}' from {file_path}")
+    return None
+
+def _parse_exif_date(file_path, parse_png=False):
+    """Parse the EXIF/video date out of a file, bypassing the cache."""
+    file_ext = Path(file_path).suffix.lower()
+    try:
+        if file_ext == '.png':
+            return _parse_png_date(file_path) if parse_png else None
+
+        # Prefer the C-backed parser when available; fall back to exifread
+        # if it's missing, errors out, or finds nothing
+        if pyexiv2 is not None and file_ext not in VIDEO_EXTS:
+            try:
+                date = _parse_exif_date_native(file_path)
+                if date is not None:
+                    return date
+            except Exception as e:
+                logger.debug(f"pyexiv2 parse failed for {file_path}, falling back to exifread: {e}")
+
+        tags = _read_exif_tags(file_path)
+
+        # Videos carry QuickTime tags and images carry EXIF tags; scanning
+        # the other list is wasted lookups that almost never match, so each
+        # file type checks only its own tags (in order of preference)
+        if file_ext in VIDEO_EXTS:
+            tag_list, tag_set = VIDEO_DATE_TAGS, _VIDEO_TAG_SET
+        else:
+            tag_list, tag_set = EXIF_DATE_TAGS, _EXIF_TAG_SET
+
+        # One set intersection finds which date tags exist; the common
+        # "no date tag at all" case costs a single hash scan instead of
+        # one dict probe per candidate, and priority order still wins
+        # among the tags that are present
+        present = tag_set & tags.keys()
+        if present:
+            for tag in tag_list:
+                if tag in present:
+                    # The fixed-offset parser handles all the separator
+                    # variants these dates come in (:, - and /)
                     date_str = str(tags[tag])
-                    try:
-                        # Video dates might be in different formats
-                        # Try common video date formats
-                        for fmt in ['%Y:%m:%d %H:%M:%S', '%Y-%m-%d %H:%M:%S', '%Y/%m/%d %H:%M:%S']:
-                            try:
-                                return datetime.strptime(date_str, fmt)
-                            except ValueError:
-                                continue
-                        logger.warning(f"Could not parse video date '{date_str}' from {file_path}")
-                    except Exception:
-                        continue
-        
-        # For image files, check EXIF tags
-        for tag in EXIF_DATE_TAGS:
-            if tag in tags:
-                date_str = str(tags[tag])
-                try:
-                    # Parse the date string (format: YYYY:MM:DD HH:MM:SS)
-                    return datetime.strptime(date_str, '%Y:%m:%d %H:%M:%S')
-                except ValueError:
+                    date = _parse_exif_datetime(date_str)
+                    if date is not None:
+                        return date
                     logger.warning(f"Could not parse date '{date_str}' from {file_path}")
-                    continue
         
-        # For PNG files, provide specific message
-        if file_ext == '.png':
-            logger.warning(f"No EXIF date found in PNG file {file_path} - PNG files typically don't contain EXIF metadata")
-        else:
-            logger.warning(f"No valid date metadata found in {file_path}")
+        logger.warning(f"No valid date metadata found in {file_path}")
         return None
         
     except Exception as e:
@@ -109,10 +391,70 @@ def get_exif_date(file_path):
             logger.error(f"Error reading metadata from {file_path}: {error_msg}")
         return None
 
-def update_creation_date(file_path, date):
+def _as_path_stat(item):
+    """Normalize a walker item to a (file_path, stat_result_or_None) pair."""
+    return item if isinstance(item, tuple) else (item, None)
+
+def extract_exif_dates(image_files, max_workers=None, parse_png=False):
+    """
+    Extract EXIF dates for an iterable of files, yielding (file_path, date)
+    pairs as each parse completes.
+
+    exifread spends most of its time blocked in file reads, which release
+    the GIL, so a thread pool overlaps the I/O waits without the process
+    startup and pickling costs of a process pool. Accepts any iterable
+    (e.g. the streaming directory walker) without materializing it first:
+    submission consumes the iterable while workers are already parsing, so
+    the walk overlaps with the parses. Items may be plain paths or
+    (path, stat_result) pairs from the walker's with_stats mode, in which
+    case the stat is reused for the cache key instead of re-fetched.
+    Small batches are parsed serially since pool startup costs more than
+    the parse itself.
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count()
+
+    files = iter(image_files)
+    head = list(itertools.islice(files, MIN_PARALLEL_FILES))
+
+    if len(head) < MIN_PARALLEL_FILES:
+        for file_path, st in map(_as_path_stat, head):
+            yield file_path, get_exif_date(file_path, parse_png=parse_png, stat_result=st)
+        return
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(get_exif_date, file_path, parse_png, st): file_path
+                   for file_path, st in map(_as_path_stat, itertools.chain(head, files))}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+def _set_creation_date_native(file_path, date):
     """
-    Update the creation date of a file using macOS's SetFile command.
+    Set the creation date in-process via the Foundation framework.
+    Returns True on success.
     """
+    url = NSURL.fileURLWithPath_(str(file_path))
+    ns_date = NSDate.dateWithTimeIntervalSince1970_(date.timestamp())
+    ok, _error = url.setResourceValue_forKey_error_(ns_date, NSURLCreationDateKey, None)
+    return bool(ok)
+
+def update_creation_date(file_path, date, use_setfile=False):
+    """
+    Update the creation date of a file.
+
+    Uses the Foundation framework in-process when pyobjc is available;
+    falls back to macOS's SetFile command otherwise, or when use_setfile
+    is set.
+    """
+    if NSURL is not None and not use_setfile:
+        try:
+            if _set_creation_date_native(file_path, date):
+                logger.info(f"Updated creation date for {file_path} to {date}")
+                return True
+            logger.warning(f"Native creation date update failed for {file_path}, falling back to SetFile")
+        except Exception as e:
+            logger.warning(f"Native creation date update failed for {file_path}, falling back to SetFile: {e}")
+
     try:
         # Format date for SetFile command (MM/DD/YYYY HH:MM:SS)
         date_str = date.strftime('%m/%d/%Y %H:%M:%S')
@@ -132,13 +474,73 @@ def update_creation_date(file_path, date):
         logger.error(f"Error updating creation date for {file_path}: {e}")
         return False
 
-def process_directory(directory_path, dry_run=False):
+def update_creation_dates(updates, use_setfile=False):
+    """
+    Update creation dates for many files.
+
+    When pyobjc is available the updates are made in-process, one Foundation
+    call per file with no subprocess at all. Otherwise (or when use_setfile
+    is set) files are grouped by their formatted date and passed to SetFile
+    in batches of SETFILE_BATCH_SIZE, amortizing the fork/exec cost that
+    dominates on large directories. A failed batch is retried file by file
+    so one bad path doesn't sink its whole batch.
+
+    Args:
+        updates: iterable of (file_path, datetime) pairs
+        use_setfile (bool): force the SetFile path even if pyobjc is present
+
+    Returns:
+        Tuple of (updated_count, error_count).
+    """
+    if NSURL is not None and not use_setfile:
+        updated_count = 0
+        error_count = 0
+        for file_path, date in updates:
+            if update_creation_date(file_path, date):
+                updated_count += 1
+            else:
+                error_count += 1
+        return updated_count, error_count
+
+    # Group files by formatted date so each batch shares one -d argument
+    files_by_date = {}
+    for file_path, date in updates:
+        date_str = date.strftime('%m/%d/%Y %H:%M:%S')
+        files_by_date.setdefault(date_str, []).append(file_path)
+
+    updated_count = 0
+    error_count = 0
+
+    for date_str, file_paths in files_by_date.items():
+        for start in range(0, len(file_paths), SETFILE_BATCH_SIZE):
+            batch = file_paths[start:start + SETFILE_BATCH_SIZE]
+            cmd = ['SetFile', '-d', date_str] + list(batch)
+            result = subprocess.run(cmd, capture_output=True, text=True)
+
+            if result.returncode == 0:
+                for file_path in batch:
+                    logger.info(f"Updated creation date for {file_path} to {date_str}")
+                updated_count += len(batch)
+            else:
+                logger.warning(f"Batch update of {len(batch)} files failed, retrying individually: {result.stderr}")
+                for file_path in batch:
+                    if update_creation_date(file_path, datetime.strptime(date_str, '%m/%d/%Y %H:%M:%S'), use_setfile=True):
+                        updated_count += 1
+                    else:
+                        error_count += 1
+
+    return updated_count, error_count
+
+def process_directory(directory_path, dry_run=False, use_setfile=False, parse_png=False, jobs=None):
     """
     Process all supported image files in the directory and update their creation dates.
-    
+
     Args:
         directory_path (str): Path to the directory containing images
         dry_run (bool): If True, only show what would be done without making changes
+        use_setfile (bool): Force SetFile updates even if pyobjc is available
+        parse_png (bool): Look for dates in PNG text chunks (requires Pillow)
+        jobs (int): Number of parallel metadata readers (default: CPU count)
     """
     directory = Path(directory_path)
     
@@ -150,43 +552,43 @@ def process_directory(directory_path, dry_run=False):
         logger.error(f"Path is not a directory: {directory_path}")
         return
     
-    # Find all supported image files
-    image_files = []
-    for file_path in directory.rglob('*'):
-        if file_path.is_file() and is_supported_format(file_path):
-            image_files.append(file_path)
-    
-    if not image_files:
-        logger.info(f"No supported image files found in {directory_path}")
-        return
-    
-    logger.info(f"Found {len(image_files)} image files to process")
-    
+    found_count = 0
     updated_count = 0
     skipped_count = 0
     error_count = 0
-    
-    for file_path in image_files:
+    pending_updates = []
+
+    # Stream the directory walk straight into the parser pool instead of
+    # listing the whole tree up front, collecting the updates to apply.
+    # The walk carries each file's stat along so the cache key costs no
+    # second lookup per file.
+    for file_path, exif_date in extract_exif_dates(iter_supported_files(directory, with_stats=True), max_workers=jobs, parse_png=parse_png):
+        found_count += 1
         logger.info(f"Processing: {file_path}")
-        
-        # Get EXIF date
-        exif_date = get_exif_date(file_path)
-        
+
         if exif_date is None:
             logger.warning(f"Skipping {file_path} - no EXIF date found")
             skipped_count += 1
             continue
-        
+
         if dry_run:
             logger.info(f"[DRY RUN] Would update {file_path} creation date to {exif_date}")
             updated_count += 1
         else:
-            # Update the creation date
-            if update_creation_date(file_path, exif_date):
-                updated_count += 1
-            else:
-                error_count += 1
-    
+            pending_updates.append((file_path, exif_date))
+
+    if not found_count:
+        logger.info(f"No supported image files found in {directory_path}")
+        return
+
+    logger.info(f"Found {found_count} image files to process")
+
+    # Apply the updates in batched SetFile invocations
+    if pending_updates:
+        updated, errors = update_creation_dates(pending_updates, use_setfile=use_setfile)
+        updated_count += updated
+        error_count += errors
+
     # Summary
     logger.info(f"\nProcessing complete:")
     logger.info(f"  - Files updated: {updated_count}")
@@ -221,7 +623,26 @@ Examples:
         action='store_true',
         help='Enable verbose logging'
     )
-    
+
+    parser.add_argument(
+        '--use-setfile',
+        action='store_true',
+        help='Use the SetFile command even if pyobjc is available'
+    )
+
+    parser.add_argument(
+        '--parse-png',
+        action='store_true',
+        help='Look for dates in PNG text chunks (requires Pillow)'
+    )
+
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=os.cpu_count(),
+        help='Number of parallel metadata readers (default: CPU count; use a low value for spinning disks)'
+    )
+
     args = parser.parse_args()
     
     if args.verbose:
@@ -235,15 +656,16 @@ Examples:
         logger.error("This script is designed for macOS only")
         sys.exit(1)
     
-    # Check if SetFile command is available
-    try:
-        subprocess.run(['SetFile', '-h'], capture_output=True, check=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        logger.error("SetFile command not found. This script requires macOS.")
-        sys.exit(1)
-    
+    # Check if SetFile command is available (only needed when pyobjc isn't)
+    if NSURL is None or args.use_setfile:
+        try:
+            subprocess.run(['SetFile', '-h'], capture_output=True, check=True)
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            logger.error("SetFile command not found. This script requires macOS.")
+            sys.exit(1)
+
     # Process the directory
-    process_directory(args.directory, args.dry_run)
+    process_directory(args.directory, args.dry_run, use_setfile=args.use_setfile, parse_png=args.parse_png, jobs=args.jobs)
 
 if __name__ == '__main__':
     main() 
\ No newline at end of file
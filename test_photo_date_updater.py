@@ -8,6 +8,7 @@ including unit tests for individual functions and integration tests for the full
 
 import unittest
 import tempfile
+import threading
 import os
 import shutil
 from datetime import datetime
@@ -18,10 +19,13 @@ import sys
 # Add the current directory to the path so we can import the module
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+import photo_date_updater
 from photo_date_updater import (
     is_supported_format,
+    iter_supported_files,
     get_exif_date,
     update_creation_date,
+    update_creation_dates,
     process_directory,
     SUPPORTED_FORMATS,
     EXIF_DATE_TAGS
@@ -36,13 +40,27 @@ class TestPhotoDateUpdater(unittest.TestCase):
         self.temp_dir = tempfile.mkdtemp()
         self.test_files = []
 
+        # Point the EXIF cache at the temp directory so tests never touch
+        # the real ~/.cache, and drop connections from previous tests
+        cache_dir = os.path.join(self.temp_dir, 'cache')
+        self.cache_patcher = patch.multiple(
+            'photo_date_updater',
+            CACHE_DIR=cache_dir,
+            CACHE_DB=os.path.join(cache_dir, 'exif.db')
+        )
+        self.cache_patcher.start()
+        photo_date_updater._cache_local = threading.local()
+
     def tearDown(self):
         """Clean up test fixtures."""
+        self.cache_patcher.stop()
+        photo_date_updater._cache_local = threading.local()
+
         # Remove test files
         for file_path in self.test_files:
             if os.path.exists(file_path):
                 os.remove(file_path)
-        
+
         # Remove temp directory
         if os.path.exists(self.temp_dir):
             shutil.rmtree(self.temp_dir)
@@ -69,6 +87,30 @@ class TestPhotoDateUpdater(unittest.TestCase):
             filename = f"test{ext}"
             self.assertFalse(is_supported_format(filename), f"Should not support {ext}")
 
+    def test_iter_supported_files_recursive(self):
+        """Test that the directory walker finds supported files recursively."""
+        test_jpg = self.create_test_file('test1.jpg')
+        test_txt = self.create_test_file('test2.txt')  # Should be ignored
+
+        # Supported file in a nested subdirectory
+        sub_dir = os.path.join(self.temp_dir, 'nested')
+        os.makedirs(sub_dir)
+        nested_png = os.path.join(sub_dir, 'test3.png')
+        with open(nested_png, 'wb') as f:
+            f.write(b'')
+        self.test_files.append(nested_png)
+
+        found = sorted(str(p) for p in iter_supported_files(self.temp_dir))
+
+        self.assertIn(test_jpg, found)
+        self.assertIn(nested_png, found)
+        self.assertNotIn(test_txt, found)
+
+        # with_stats=True carries each file's stat along with its path
+        for file_path, stat_result in iter_supported_files(self.temp_dir, with_stats=True):
+            self.assertIn(str(file_path), found)
+            self.assertIsNotNone(stat_result)
+
     @patch('photo_date_updater.exifread.process_file')
     def test_get_exif_date_success(self, mock_process_file):
         """Test successful EXIF date extraction."""
@@ -137,6 +179,36 @@ class TestPhotoDateUpdater(unittest.TestCase):
         self.assertEqual(result.month, 6)
         self.assertEqual(result.day, 20)
 
+    @patch('photo_date_updater.exifread.process_file')
+    def test_get_exif_date_uses_cache(self, mock_process_file):
+        """Test that repeat calls hit the cache instead of re-parsing."""
+        mock_tags = {'EXIF DateTimeOriginal': '2023:05:15 14:30:25'}
+        mock_process_file.return_value = mock_tags
+
+        test_file = self.create_test_file('test.jpg', content=b'photo data')
+        first = get_exif_date(test_file)
+        self.assertEqual(mock_process_file.call_count, 1)
+
+        # Second call should be served from the cache without a parse
+        second = get_exif_date(test_file)
+        self.assertEqual(mock_process_file.call_count, 1)
+        self.assertEqual(first, second)
+
+        # Changing the file invalidates the entry and forces a re-parse
+        with open(test_file, 'wb') as f:
+            f.write(b'different photo data')
+        get_exif_date(test_file)
+        self.assertEqual(mock_process_file.call_count, 2)
+
+    @patch('photo_date_updater.exifread.process_file')
+    def test_get_exif_date_skips_png(self, mock_process_file):
+        """Test that PNG files are skipped without being parsed by default."""
+        test_file = self.create_test_file('test.png')
+        result = get_exif_date(test_file)
+
+        self.assertIsNone(result)
+        mock_process_file.assert_not_called()
+
     @patch('photo_date_updater.subprocess.run')
     def test_update_creation_date_success(self, mock_run):
         """Test successful creation date update."""
@@ -173,6 +245,35 @@ class TestPhotoDateUpdater(unittest.TestCase):
 
         self.assertFalse(result)
 
+    @patch('photo_date_updater.subprocess.run')
+    def test_update_creation_dates_batches_by_date(self, mock_run):
+        """Test that batch updates group files sharing a date into one SetFile call."""
+        # Mock successful SetFile command
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_run.return_value = mock_result
+
+        file1 = self.create_test_file('test1.jpg')
+        file2 = self.create_test_file('test2.jpg')
+        file3 = self.create_test_file('test3.jpg')
+        shared_date = datetime(2023, 5, 15, 14, 30, 25)
+        other_date = datetime(2023, 6, 20, 10, 15, 30)
+
+        updated, errors = update_creation_dates([
+            (file1, shared_date),
+            (file2, shared_date),
+            (file3, other_date)
+        ])
+
+        self.assertEqual(updated, 3)
+        self.assertEqual(errors, 0)
+
+        # One call per distinct date, with files sharing a date batched together
+        self.assertEqual(mock_run.call_count, 2)
+        batched_files = {args[0][0][2]: args[0][0][3:] for args in mock_run.call_args_list}
+        self.assertEqual(batched_files['05/15/2023 14:30:25'], [file1, file2])
+        self.assertEqual(batched_files['06/20/2023 10:15:30'], [file3])
+
     def test_process_directory_nonexistent(self):
         """Test processing a non-existent directory."""
         with self.assertLogs(level='ERROR') as log:
@@ -200,7 +301,7 @@ class TestPhotoDateUpdater(unittest.TestCase):
         self.assertTrue(any('No supported image files found' in msg for msg in log.output))
 
     @patch('photo_date_updater.get_exif_date')
-    @patch('photo_date_updater.update_creation_date')
+    @patch('photo_date_updater.update_creation_dates')
     def test_process_directory_with_images(self, mock_update, mock_get_exif):
         """Test processing a directory with images."""
         # Create test image files
@@ -211,16 +312,15 @@ class TestPhotoDateUpdater(unittest.TestCase):
         # Mock EXIF date extraction
         test_date = datetime(2023, 5, 15, 14, 30, 25)
         mock_get_exif.return_value = test_date
-        
-        # Mock successful date update
-        mock_update.return_value = True
+
+        # Mock successful date updates
+        mock_update.return_value = (2, 0)
 
         with self.assertLogs(level='INFO') as log:
             process_directory(self.temp_dir)
 
         # Should process 2 image files (jpg and png)
         self.assertEqual(mock_get_exif.call_count, 2)
-        self.assertEqual(mock_update.call_count, 2)
 
         # Check that the correct files were processed
         processed_files = [str(call[0][0]) for call in mock_get_exif.call_args_list]
@@ -228,6 +328,12 @@ class TestPhotoDateUpdater(unittest.TestCase):
         self.assertIn(test_png, processed_files)
         self.assertNotIn(test_txt, processed_files)
 
+        # Both files should be handed to the batch update in one call
+        mock_update.assert_called_once()
+        updated_files = [str(p) for p, d in mock_update.call_args[0][0]]
+        self.assertIn(test_jpg, updated_files)
+        self.assertIn(test_png, updated_files)
+
     @patch('photo_date_updater.get_exif_date')
     @patch('photo_date_updater.update_creation_date')
     def test_process_directory_dry_run(self, mock_update, mock_get_exif):
@@ -270,13 +376,13 @@ class TestPhotoDateUpdater(unittest.TestCase):
 
     def test_exif_date_tags_order(self):
         """Test that EXIF date tags are in the correct priority order."""
-        expected_order = [
+        expected_order = (
             'EXIF DateTimeOriginal',
             'EXIF DateTime',
             'Image DateTime',
             'EXIF SubSecTimeOriginal',
             'EXIF SubSecTime'
-        ]
+        )
         self.assertEqual(EXIF_DATE_TAGS, expected_order)
 
 
@@ -330,17 +436,20 @@ class TestIntegration(unittest.TestCase):
             with self.assertLogs(level='INFO') as log:
                 process_directory(self.temp_dir)
 
-            # Verify that SetFile was called for each image
-            self.assertEqual(mock_run.call_count, 2)
-
-            # Verify the correct date format was used
-            for call in mock_run.call_args_list:
-                args = call[0][0]
-                self.assertEqual(args[0], 'SetFile')
-                self.assertEqual(args[1], '-d')
-                # Check date format: MM/DD/YYYY HH:MM:SS
-                date_str = args[2]
-                self.assertRegex(date_str, r'\d{2}/\d{2}/\d{4} \d{2}:\d{2}:\d{2}')
+            # Both images share the same date, so SetFile is called once
+            # with both files batched into the invocation
+            self.assertEqual(mock_run.call_count, 1)
+
+            args = mock_run.call_args[0][0]
+            self.assertEqual(args[0], 'SetFile')
+            self.assertEqual(args[1], '-d')
+            # Check date format: MM/DD/YYYY HH:MM:SS
+            date_str = args[2]
+            self.assertRegex(date_str, r'\d{2}/\d{2}/\d{4} \d{2}:\d{2}:\d{2}')
+            # Both image files should be in the batch
+            batched = [str(p) for p in args[3:]]
+            self.assertIn(test_jpg, batched)
+            self.assertIn(test_png, batched)
 
 
 if __name__ == '__main__':